@@ -21,6 +21,7 @@ __all__ = [
     'ParserError',
 
     'TreeBuilder',
+    'EventBuilder',
     'BuilderError',
 ]
 
@@ -1,7 +1,11 @@
 """
 BaseClass Tokenizer Implementation for various Lexers
 """
-from typing import NamedTuple, Optional, Iterator, Generator
+import re
+from functools import lru_cache
+from itertools import islice
+from mmap import mmap
+from typing import NamedTuple, Optional, Iterator, Generator, Pattern, Union
 
 #** Variables **#
 __all__ = [
@@ -27,8 +31,37 @@ NEWLINE = ord('\n')
 #: back slash character byte
 BACK_SLASH = ord('\\')
 
-#: typehint for data stream of single bytes
-DataStream = Iterator[int]
+#: regex expression to find the next non-space character
+re_non_space = re.compile(rb'[^\n\r\t ]')
+
+#: typehint for data stream of byte chunks (or legacy single byte integers)
+DataStream = Iterator[Union[bytes, int]]
+
+#: number of single byte integers grouped into each chunk
+INT_CHUNK_SIZE = 8192
+
+#** Functions **#
+
+@lru_cache(maxsize=None)
+def word_end(terminate: Optional[bytes] = None) -> Pattern[bytes]:
+    """compile regex to find the end of a word w/ optional terminators"""
+    return re.compile(b'[%s]' % re.escape(SPACES + (terminate or b'')))
+
+def iter_chunks(stream: DataStream) -> Iterator[bytes]:
+    """adapt data-stream of byte chunks or single byte integers into chunks"""
+    for first in stream:
+        if isinstance(first, int):
+            # group single byte integers rather than indexing one at a time
+            yield bytes((first, *islice(stream, INT_CHUNK_SIZE - 1)))
+            while (chunk := bytes(islice(stream, INT_CHUNK_SIZE))):
+                yield chunk
+            return
+        if not isinstance(first, (bytes, bytearray, memoryview, mmap)):
+            raise TypeError(
+                f'data-stream must yield bytes or ints, not {type(first)!r}')
+        yield first
+        yield from stream #type: ignore
+        return
 
 #** Classes **#
 
@@ -42,11 +75,22 @@ class BaseLexer:
     """
     BaseClass Instance of Tokenizer Implementation
     """
-    __slots__ = ('stream', 'buffer', 'last_token', 'lineno', 'position')
+    __slots__ = (
+        'stream', 'buffer', 'bufpos', 'data', 'cursor',
+        'last_token', 'lineno', 'position')
 
-    def __init__(self, stream: DataStream):
+    def __init__(self, stream: Union[bytes, DataStream]):
+        # read directly from memory when given the complete data
+        if isinstance(stream, bytes):
+            self.data = stream
+            stream    = iter(())
+        else:
+            self.data = b''
+            stream    = iter_chunks(iter(stream))
         self.stream = stream
         self.buffer = bytearray()
+        self.bufpos = 0
+        self.cursor = 0
         self.last_token = 0
         self.lineno     = 1
         self.position   = 0
@@ -55,19 +99,36 @@ class BaseLexer:
         """
         read next byte from array
         """
-        if not self.buffer:
-            try:
-                char = next(self.stream)
-            except StopIteration:
-                return
+        buffer = self.buffer
+        if buffer:
+            # advance buffer index rather than shifting remaining bytes
+            char = buffer[self.bufpos]
+            self.bufpos += 1
+            if self.bufpos == len(buffer):
+                buffer.clear()
+                self.bufpos = 0
+        elif self.cursor < len(self.data) or self.read_chunk():
+            char = self.data[self.cursor]
+            self.cursor += 1
         else:
-            char = self.buffer.pop(0)
+            return
         if char == NEWLINE:
             self.lineno  += 1
             self.position = 0
         self.position += 1
         return char
 
+    def read_chunk(self) -> bool:
+        """
+        replace exhausted in-memory data with the next chunk from the stream
+        """
+        for chunk in self.stream:
+            if chunk:
+                self.data   = chunk
+                self.cursor = 0
+                return True
+        return False
+
     def unread(self, *data):
         """
         unread bytes from the data-stream
@@ -75,49 +136,132 @@ class BaseLexer:
         self.position -= len(data)
         if NEWLINE in data or self.position < 0:
             raise RuntimeError('unable to track position!')
-        self.buffer = bytearray(data) + self.buffer
+        self.pushback(bytes(data))
+
+    def pushback(self, data: bytes):
+        """
+        return bytes to the front of the data-stream w/o position tracking
+        """
+        # rewind in-memory cursor when possible, else push into buffer
+        start = self.cursor - len(data)
+        if not self.buffer and start >= 0 \
+            and self.data[start:self.cursor] == data:
+            self.cursor = start
+        elif self.bufpos >= len(data):
+            self.bufpos -= len(data)
+            self.buffer[self.bufpos:self.bufpos + len(data)] = data
+        else:
+            self.buffer = bytearray(data) + self.buffer[self.bufpos:]
+            self.bufpos = 0
+
+    def merge_buffer(self):
+        """
+        move pushed-back bytes into in-memory data to allow bulk scans
+        """
+        if self.buffer:
+            self.data   = bytes(self.buffer[self.bufpos:]) + self.data[self.cursor:]
+            self.cursor = 0
+            self.bufpos = 0
+            self.buffer.clear()
+
+    def search(self, pattern: Pattern[bytes]) -> int:
+        """
+        find index of next pattern match within in-memory data
+        """
+        self.merge_buffer()
+        match = pattern.search(self.data, self.cursor)
+        return match.start() if match else len(self.data)
+
+    def read_into(self, value: bytearray, end: int):
+        """
+        bulk read in-memory data up until the specified index
+        """
+        chunk       = self.data[self.cursor:end]
+        self.cursor = end
+        newlines    = chunk.count(NEWLINE)
+        if newlines:
+            self.lineno  += newlines
+            self.position = len(chunk) - chunk.rfind(NEWLINE)
+        else:
+            self.position += len(chunk)
+        value += chunk
+
+    def read_until(self, value: bytearray, pattern: Pattern[bytes]) -> bool:
+        """
+        bulk read data across stream chunks up until the next pattern match
+        """
+        while True:
+            end = self.search(pattern)
+            self.read_into(value, end)
+            if end < len(self.data):
+                return True
+            if not self.read_chunk():
+                return False
+
+    def read_before(self, value: bytearray, end: bytes) -> bool:
+        """
+        bulk read data across stream chunks up until the specified terminator
+        """
+        while True:
+            self.merge_buffer()
+            index = self.data.find(end, self.cursor)
+            if index >= 0:
+                self.read_into(value, index)
+                return True
+            # keep a possible partial terminator to join w/ the next chunk
+            self.read_into(value, max(self.cursor, len(self.data) - len(end) + 1))
+            partial = self.data[self.cursor:]
+            if not self.read_chunk():
+                self.read_into(value, len(self.data))
+                return False
+            self.data = partial + self.data
 
     def skip_spaces(self):
         """
         skip and ignore all whitespace until next text-block
         """
-        while True:
-            char = self.read_byte()
-            if char is None:
-                break
-            if char not in SPACES:
-                self.unread(char)
-                break
+        self.read_until(bytearray(), re_non_space)
 
     def read_word(self, value: bytearray, terminate: Optional[bytes] = None):
         """
         read buffer until a space is found or special terminators
         """
-        while True:
-            char = self.read_byte()
-            if char is None or char in SPACES:
-                break
-            if terminate and char in terminate:
-                self.unread(char)
-                break
-            value.append(char)
+        if self.read_until(value, word_end(terminate)) \
+            and self.data[self.cursor] in SPACES:
+            self.read_byte()
 
     def read_quote(self, quote: int, value: bytearray):
         """
         read quoted value
         """
-        escapes = 0
+        needle  = bytes((quote, )) # mmap.find only accepts bytes-like
+        escapes = 0 # trailing back-slashes carried over from previous chunk
         while True:
-            char = self.read_byte()
-            if char is None:
-                break
-            # check if quote is escaped
-            if char == quote:
-                if escapes % 2 == 0:
-                    break
-            # track escapes to know if quote is escaped or not
-            escapes = (escapes + 1) if char == BACK_SLASH else 0
-            value.append(char)
+            self.merge_buffer()
+            data, cursor = self.data, self.cursor
+            index = data.find(needle, cursor)
+            while index >= 0:
+                # quote is escaped when preceded by an odd number of slashes
+                if (self.count_escapes(cursor, index, escapes) % 2) == 0:
+                    self.read_into(value, index)
+                    self.cursor   += 1
+                    self.position += 1
+                    return
+                index = data.find(needle, index + 1)
+            escapes = self.count_escapes(cursor, len(data), escapes)
+            self.read_into(value, len(data))
+            if not self.read_chunk():
+                return
+
+    def count_escapes(self, start: int, end: int, carry: int) -> int:
+        """
+        count consecutive back-slashes in in-memory data directly before end
+        """
+        data  = self.data
+        index = end
+        while index > start and data[index - 1] == BACK_SLASH:
+            index -= 1
+        return end - index + (carry if index == start else 0)
 
     def _next(self) -> Result:
         raise NotImplementedError
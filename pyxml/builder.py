@@ -2,12 +2,15 @@
 XML Tree Builder Implementation
 """
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from .element import *
 
 #** Variables **#
-__all__ = ['BuilderError', 'TreeBuilder']
+__all__ = ['BuilderError', 'TreeBuilder', 'EventBuilder']
+
+#: parsing event typehint (event-name followed by event values)
+Event = Tuple[Any, ...]
 
 #** Classes **#
 
@@ -26,8 +29,10 @@ class TreeBuilder:
     insert_declares: bool              = False
     insert_pis:      bool              = False
     fix_broken:      bool              = False
+    intern_names:    bool              = True
 
     def __post_init__(self):
+        self.names: Dict[str, str]    = {}
         self.last:  Optional[Element] = self.root
         self.tree:  List[Element]     = [] if self.root is None else [self.root]
         self.text:  List[str]         = []
@@ -36,12 +41,12 @@ class TreeBuilder:
 
     def _flush(self):
         """flush collected text to right position in tree"""
-        if not self.data:
+        if not self.text:
             return
+        text = ''.join(self.text)
+        self.text.clear()
         if self.last is None:
-            self.text = []
             return
-        text = ''.join(self.text)
         if self.tail:
             if self.last.tail:
                 if self.fix_broken:
@@ -56,7 +61,6 @@ class TreeBuilder:
                     return
                 raise BuilderError('Element text already assigned')
             self.last.text = text
-        self.text = []
 
     def _append(self, elem: Element):
         """append new element to the tree"""
@@ -86,6 +90,11 @@ class TreeBuilder:
     def start(self, tag: str, attrs: Dict[str, str]):
         """process start of a new tag and update tree"""
         self._flush()
+        if self.intern_names:
+            # reuse a single string object for repeated tag/attribute names
+            names = self.names
+            tag   = names.setdefault(tag, tag)
+            attrs = {names.setdefault(k, k):v for k,v in attrs.items()}
         elem = self.element_factory(tag, attrs)
         self._append(elem)
         self.tree.append(elem)
@@ -146,3 +155,38 @@ class TreeBuilder:
         if self.root is None:
             raise BuilderError('Missing Toplevel Element')
         return self.root
+
+class EventBuilder:
+    """Parser Target Collecting Events w/o Building an Element Tree"""
+    __slots__ = ('events', )
+
+    def __init__(self):
+        self.events: List[Event] = []
+
+    def start(self, tag: str, attrs: Dict[str, str]):
+        """record start of a new tag"""
+        self.events.append(('start', tag, attrs))
+
+    def end(self, tag: str):
+        """record end of an existing tag"""
+        self.events.append(('end', tag))
+
+    def data(self, data: str):
+        """record incoming text block"""
+        self.events.append(('data', data))
+
+    def comment(self, text: str):
+        """record comment"""
+        self.events.append(('comment', text))
+
+    def declaration(self, declaration: str):
+        """record declaration"""
+        self.events.append(('declaration', declaration))
+
+    def pi(self, target: str, pi: str):
+        """record processing instruction"""
+        self.events.append(('pi', target, pi))
+
+    def close(self):
+        """close builder (no tree is ever built)"""
+        return None
@@ -13,6 +13,9 @@ __all__ = [
     'ProcessingInstruction',
 ]
 
+#: cached opening-tag typehint (tag, attributes snapshot, serialized tag)
+OpenCache = Tuple[str, Dict[str, str], str]
+
 #** Functions **#
 
 def prettify(element: 'Element', indent: int = 2):
@@ -38,7 +41,9 @@ def prettify(element: 'Element', indent: int = 2):
 
 class Element:
     """XML Element Object Definition"""
-    __slots__ = ('tag', 'attrib', 'parent', 'children', 'text', 'tail')
+    __slots__ = (
+        'tag', 'attrib', 'parent', 'children', 'text', 'tail',
+        '_positions', '_open_cache')
 
     def __init__(self, tag, attrib=None, **extra):
         self.tag = tag
@@ -47,6 +52,8 @@ class Element:
         self.children: List[Element]     = []
         self.text:     Optional[str]     = None
         self.tail:     Optional[str]     = None
+        self._positions: Optional[Dict[int, int]] = None
+        self._open_cache: Optional[OpenCache]      = None
 
     def __repr__(self) -> str:
         return 'Element(tag=%r, attrib=%r)' % (self.tag, self.attrib)
@@ -71,16 +78,37 @@ class Element:
         """legacy support `makeelement` function"""
         return cls(tag, attrib)
 
+    def index(self, element: 'Element') -> int:
+        """retrieve index of child element (cached for repeated lookups)"""
+        children  = self.children
+        positions = self._positions
+        if positions is not None:
+            index = positions.get(id(element))
+            if index is not None and index < len(children) \
+                and children[index] is element:
+                return index
+        # rebuild cache when missing or when children have been modified
+        positions = {}
+        for n, child in enumerate(children):
+            # keep the first position of repeated children like `list.index`
+            positions.setdefault(id(child), n)
+        self._positions = positions
+        if id(element) not in positions:
+            raise ValueError(f'{element!r} is not a child of {self!r}')
+        return positions[id(element)]
+
     def insert(self, index: int, element: 'Element'):
         self.children.insert(index, element)
+        element.parent = self
 
     def append(self, element: 'Element'):
         self.children.append(element)
         element.parent = self
 
     def extend(self, elements: Iterator['Element']):
-        self.children.extend(elements)
+        children = self.children
         for elem in elements:
+            children.append(elem)
             elem.parent = self
 
     def remove(self, element: 'Element'):
@@ -128,17 +156,34 @@ class Element:
 
     def iter(self, tag: Optional[bytes] = None) -> Iterator['Element']:
         """iterate all children recursively from parent"""
-        if tag is None or tag == self.tag:
-            yield self
-        for child in self.children:
-            yield from child.iter(tag)
+        if tag is None:
+            return self._iter()
+        return (elem for elem in self._iter() if elem.tag == tag)
+
+    def _iter(self) -> Iterator['Element']:
+        """iterate all children from parent in document order"""
+        stack = [self]
+        while stack:
+            elem = stack.pop()
+            yield elem
+            stack.extend(reversed(elem.children))
 
     def itertext(self):
-        """iterate all elements with text in them and retreieve values"""
-        if self.text:
-            yield self.text
-        for child in self.children:
-            yield from child.itertext()
+        """iterate all text and tails of children in document order"""
+        stack: List[Any] = [self]
+        while stack:
+            elem = stack.pop()
+            if type(elem) is str:
+                yield elem
+                continue
+            # queue tail to be yielded after all children are processed
+            if elem.tail and elem is not self:
+                stack.append(elem.tail)
+            if isinstance(elem, _Special):
+                continue
+            if elem.text:
+                yield elem.text
+            stack.extend(reversed(elem.children))
 
     def find(self, path: str) -> Optional[Any]:
         """retrieve single elmement matching xpath"""
@@ -177,25 +222,26 @@ class Element:
 
 class _Special(Element):
     """Baseclass for special elements such as Comments and PI"""
+    __slots__ = ()
 
     def __init__(self, text: str):
         super().__init__(self.__class__)
-        self.text   = text
-        self._cname = self.__class__.__name__
+        self.text = text
 
     def __repr__(self) -> str:
-        return f'{self._cname}(text={self.text})'
+        return f'{self.__class__.__name__}(text={self.text})'
 
     def itertext(self) -> Generator[str, None, None]:
         yield from ()
 
 class Comment(_Special):
-    pass
+    __slots__ = ()
 
 class Declaration(_Special):
-    pass
+    __slots__ = ()
 
 class ProcessingInstruction(_Special):
+    __slots__ = ('target', 'value')
 
     def __init__(self, target: str, value: str):
         super().__init__(f'{target} {value}')
@@ -2,6 +2,7 @@
 Escape/Unescape Utilities for XML Handling
 """
 import re
+from functools import lru_cache
 from typing import List
 
 #** Variables **#
@@ -40,6 +41,12 @@ ESCAPE_ATTRIB = {
 #: reverse dictionary used to unescape special characters
 UNESCAPE_ATTRIB = {v:k for k,v in ESCAPE_ATTRIB.items()}
 
+#: find all characters requiring escape in attributes
+re_escape_attrib = re.compile('[%s]' % re.escape(''.join(ESCAPE_ATTRIB)))
+
+#: find all charrefs and entityrefs in a single pass
+re_reference = re.compile(r'&#?\w+;')
+
 #** Functions **#
 
 def find_charrefs(text: str) -> List[str]:
@@ -50,34 +57,42 @@ def find_entityrefs(text: str) -> List[str]:
     """iterate all entityrefs found in text"""
     return re_entityref.findall(text)
 
+@lru_cache(maxsize=1024)
+def _unescape_ref(ref: str) -> str:
+    """convert a single charref/entityref into its character (if known)"""
+    if ref in UNESCAPE_ATTRIB:
+        return UNESCAPE_ATTRIB[ref]
+    if ref[1] != '#':
+        return ref
+    char = ref[2:-1]
+    if len(char) % 2 == 1 and char[0] == 'x':
+        return bytes.fromhex(char[1:]).decode('latin1')
+    elif not char.isdigit():
+        raise ValueError('invalid charref', ref)
+    return chr(int(char))
+
+def _unescape(match: re.Match) -> str:
+    return _unescape_ref(match.group())
+
 def escape_cdata(text: str) -> str:
     """escape special characters for text blocks"""
-    for char, replace in ESCAPE_CDATA.items():
-        if char in text:
-            text = text.replace(char, replace)
-    return text
+    # plain substring checks are far cheaper than a regex scan
+    if '&' not in text and '<' not in text and '>' not in text:
+        return text
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
 
 def escape_attrib(text: str) -> str:
     """escape special characters for attributes"""
-    for char, replace in ESCAPE_ATTRIB.items():
+    if not text or re_escape_attrib.search(text) is None:
+        return text
+    #NOTE: ampersand is always replaced first to avoid double escapes
+    for char, escaped in ESCAPE_ATTRIB.items():
         if char in text:
-            text = text.replace(char, replace)
+            text = text.replace(char, escaped)
     return text
 
 def unescape(text: str) -> str:
     """unescape special characters for attributes"""
-    # process common xml escape sequences
-    for char, replace in UNESCAPE_ATTRIB.items():
-        if char in text:
-            text = text.replace(char, replace)
-    # process remaining charrefs
-    for match in find_charrefs(text):
-        char = match.strip('#&;')
-        if len(char) % 2 == 1 and char[0] == 'x':
-            rawchar = bytes.fromhex(char[1:]).decode('latin1')
-        elif not char.isdigit():
-            raise ValueError('invalid charref', match)
-        else:
-            rawchar = chr(int(char))
-        text = text.replace(match, rawchar)
-    return text
+    if '&' not in text:
+        return text
+    return re_reference.sub(_unescape, text)
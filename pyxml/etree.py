@@ -2,7 +2,8 @@
 XML Elements and ElementTree Implementation
 """
 from io import BytesIO
-from typing import Callable, Optional, BinaryIO, Set
+from typing import (
+    Callable, Dict, List, Optional, BinaryIO, Set, Tuple, Union)
 
 from .element import *
 from .element import _Special
@@ -12,6 +13,19 @@ from .escape import escape_cdata, escape_attrib
 #** Variables **#
 __all__ = ['tostring', 'fromstring', 'ElementTree']
 
+#: number of serialized parts collected before flushing to the writer
+FLUSH_PARTS = 4096
+
+#: special element format typehint (start, end, text-escape function)
+SpecialFormat = Tuple[str, str, Callable[[str], str]]
+
+#: serialization formats for special elements indexed by type
+SPECIALS: Dict[type, SpecialFormat] = {
+    Comment:               ('<!-- ', '-->', escape_cdata),
+    Declaration:           ('<!', '>', escape_cdata),
+    ProcessingInstruction: ('<? ', ' ?>', lambda text: text),
+}
+
 #** Functions **#
 
 def tostring(element: Element, *args, **kwargs) -> bytes:
@@ -42,9 +56,14 @@ def fromstring(text, parser: Optional[BaseParser] = None,
     write_parser(parser, text)
     return parser.close()
 
-def quote(text: str) -> str:
-    """quote escape"""
-    return '"' + escape_attrib(text) + '"'
+def special_format(element: Element) -> Optional[SpecialFormat]:
+    """retrieve special element format for element subclasses"""
+    for cls in type(element).__mro__:
+        if cls in SPECIALS:
+            return SPECIALS[cls]
+    if isinstance(element, _Special):
+        raise RuntimeError('unsupported element', element)
+    return None
 
 def serialize_any(
     write:                Callable[[str], None],
@@ -52,56 +71,75 @@ def serialize_any(
     short_empty_elements: bool,
     skip_end_tags:        Set[str],
     skip_shorten:         Set[str],
+    cache:                bool = False,
 ):
     """serialize xml/html using write function"""
-    # check if element should skip-end
-    skip_end   = skip_end_tags and element.tag in skip_end_tags
-    skip_short = skip_shorten and element.tag in skip_shorten
-    # serialize special elements differently
-    if isinstance(element, _Special):
-        func = lambda b: b
-        if isinstance(element, Comment):
-            start, end, func = '<!-- ', '-->', escape_cdata
-        elif isinstance(element, Declaration):
-            start, end, func = '<!', '>', escape_cdata
-        elif isinstance(element, ProcessingInstruction):
-            start, end = '<? ', ' ?>'
+    # walk tree w/ explicit stack of elements and pending closing-tags
+    parts: List[str]                 = []
+    stack: List[Union[Element, str]] = [element]
+    append = parts.append
+    while stack:
+        element = stack.pop()
+        if type(element) is str:
+            append(element)
+            continue
+        # flush collected parts once buffer grows large enough
+        if len(parts) >= FLUSH_PARTS:
+            write(''.join(parts))
+            parts.clear()
+        # check if element should skip-end
+        skip_end   = skip_end_tags and element.tag in skip_end_tags
+        skip_short = skip_shorten and element.tag in skip_shorten
+        tail       = escape_cdata(element.tail) if element.tail else ''
+        # serialize special elements differently
+        cls = type(element)
+        if cls is not Element:
+            special = SPECIALS.get(cls) or special_format(element)
+            if special is not None:
+                start, end, func = special
+                append(f'{start}{func(element.text or "")}{end}')
+                append(tail)
+                continue
+        # serialize normal elements accordingly (re-using cache if still valid)
+        cached = element._open_cache if cache else None
+        if cached is not None \
+            and cached[0] == element.tag and cached[1] == element.attrib:
+            opentag = cached[2]
         else:
-            raise RuntimeError('unsupported element', element)
-        write(start + func(element.text or '') + end)
-        write(escape_cdata(element.tail or ''))
-        return
-    # serialize normal elements accordingly
-    write('<' + element.tag)
-    for name, value in element.attrib.items():
-        write(' ' + name)
-        if value and value != 'true':
-            write('=')
-            write(quote(value))
-    # close w/ short form if enabled
-    if short_empty_elements and not skip_end and not skip_short \
-        and not len(element) and not element.text:
-        write('/>')
-        write(escape_cdata(element.tail or ''))
-        return
-    # close normally w/ children or otherwise disabled
-    write('>')
-    write(escape_cdata(element.text or ''))
-    for child in element:
-        serialize_any(
-            write, child, short_empty_elements, skip_end_tags, skip_shorten)
-    if not skip_end:
-        write('</' + element.tag + '>')
-    write(escape_cdata(element.tail or ''))
-
-def serialize_xml(write, element, short_empty_elements=False):
+            opentag = f'<{element.tag}'
+            if element.attrib:
+                opentag += ''.join([
+                    f' {name}="{escape_attrib(value)}"'
+                    if value and value != 'true' else f' {name}'
+                    for name, value in element.attrib.items()
+                ])
+            if cache:
+                element._open_cache = \
+                    (element.tag, dict(element.attrib), opentag)
+        append(opentag)
+        # close w/ short form if enabled
+        if short_empty_elements and not skip_end and not skip_short \
+            and not element.children and not element.text:
+            append('/>')
+            append(tail)
+            continue
+        # close normally and queue children before the closing-tag
+        append('>')
+        if element.text:
+            append(escape_cdata(element.text))
+        stack.append(tail if skip_end else f'</{element.tag}>{tail}')
+        stack.extend(reversed(element.children))
+    write(''.join(parts))
+
+def serialize_xml(write, element, short_empty_elements=False, cache=False):
     """serialize xml and write into file"""
-    serialize_any(write, element, short_empty_elements, set(), set())
+    serialize_any(write, element, short_empty_elements, set(), set(), cache)
 
-def serialize_html(write, element, short_empty_elements=False):
+def serialize_html(write, element, short_empty_elements=False, cache=False):
     """serialize html and write into file"""
     from .html.parser import HTML_FULL, HTML_EMPTY
-    serialize_any(write, element, short_empty_elements, HTML_EMPTY, HTML_FULL)
+    serialize_any(
+        write, element, short_empty_elements, HTML_EMPTY, HTML_FULL, cache)
 
 #** Classes **#
 
@@ -124,6 +162,15 @@ class ElementTree:
     def iter(self, tag=None):
         return self.getroot().iter(tag)
 
+    def reindex_parents(self):
+        """reassign parent pointers for all elements below the root"""
+        stack = [self.getroot()]
+        while stack:
+            elem = stack.pop()
+            for child in elem.children:
+                child.parent = elem
+            stack.extend(elem.children)
+
     def find(self, path: str):
         return self.getroot().find(path)
 
@@ -141,10 +188,14 @@ class ElementTree:
         xml_declaration:      Optional[str] = None,
         default_namespace:    Optional[str] = None,
         method:               Optional[str] = None,
-        short_empty_elements: bool = True
+        short_empty_elements: bool = True,
+        cache:                bool = False,
     ):
         """
+        serialize element tree and write it into the specified file
 
+        :param cache: cache serialized opening tags on each element for reuse
+            (rebuilt whenever the element's tag or attributes have changed)
         """
         encoding  = encoding or 'utf-8'
         write     = lambda s: f.write(s.encode(encoding))
@@ -156,4 +207,4 @@ class ElementTree:
                 write(f"<?xml version='1.0' encoding='{encoding}'?>\n")
         elif method == 'html':
             serialize = serialize_html
-        return serialize(write, self.getroot(), short_empty_elements)
+        return serialize(write, self.getroot(), short_empty_elements, cache)
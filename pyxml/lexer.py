@@ -1,6 +1,7 @@
 """
 Xml Parser Lexer/Tokenizer
 """
+import re
 from enum import IntEnum
 from typing import Optional
 
@@ -19,11 +20,19 @@ SLASH       = ord('/')
 OPEN_BRACK  = ord('[')
 CLOSE_BRACK = ord(']')
 
-SPECIAL    = b'=<>/'
-ONLY_SLASH = b'/'
+SPECIAL     = b'=<>/'
+COMMENT_END = b'-->'
+ONLY_SLASH  = b'/'
+ONLY_DASH   = b'-'
 
 SPECIAL_TAGS = {b'script', b'style'}
 
+#: build results via `tuple.__new__` to skip the namedtuple's python `__new__`
+new_tuple = tuple.__new__
+
+#: regex expression to find the end of a word or tag name
+re_word_end = re.compile(rb'[\n\r\t =<>/]')
+
 #** Classes **#
 
 class Token(IntEnum):
@@ -38,86 +47,80 @@ class Token(IntEnum):
     INSTRUCTION = 8
     TEXT        = 9
 
+#: plain integer token values to avoid enum lookups within the lexer loop
+(UNDEFINED, TAG_START, ATTR_NAME, ATTR_VALUE, TAG_END, TAG_CLOSE,
+    COMMENT, DECLARATION, INSTRUCTION, TEXT) = (int(token) for token in Token)
+
+#: map of integer token values back to their enum
+TOKENS = tuple(Token)
+
+#: character kinds that need context to resolve (kept above token values)
+OTHER_KIND, SLASH_KIND, EQUALS_KIND, SPACE_KIND = 0, 16, 17, 18
+
+#: character kind for every byte value (`<` and `>` map straight to tokens)
+CHAR_KINDS = bytes(
+    TAG_START   if char == OPEN_TAG  else
+    TAG_END     if char == CLOSE_TAG else
+    SLASH_KIND  if char == SLASH     else
+    EQUALS_KIND if char == EQUALS    else
+    SPACE_KIND  if char in SPACES    else OTHER_KIND
+    for char in range(256))
+
 class Lexer(BaseLexer):
-    __slots__ = ('last_tag', 'fix_broken')
+    __slots__ = ('last_tag', 'fix_broken', 'scratch')
 
     def __init__(self, stream: DataStream, fix_broken=False):
         super().__init__(stream)
         self.last_tag: Optional[bytes] = None
         self.fix_broken = fix_broken
+        self.scratch = bytearray()
 
     def read_word(self, value: bytearray, terminate = None):
         """
         read buffer until space or a special XML character arises
         """
-        while True:
-            char = self.read_byte()
-            if char is None or char in SPACES:
-                break
-            if char in SPECIAL:
-                self.unread(char)
-                break
-            value.append(char)
+        if self.read_until(value, re_word_end) \
+            and self.data[self.cursor] in SPACES:
+            self.read_byte()
 
     def read_tag(self, value: bytearray):
         """read buffer until a tag name is found"""
-        while True:
-            char = self.read_byte()
-            if char is None:
+        while self.read_until(value, re_word_end):
+            if self.data[self.cursor] not in SPACES:
                 break
-            if char in SPACES:
-                if value and value != ONLY_SLASH:
-                    break
-                continue
-            if char in SPECIAL:
-                self.unread(char)
+            self.read_byte()
+            if value and value != ONLY_SLASH:
                 break
-            value.append(char)
 
     def read_text(self, value: bytearray):
         """read buffer until text-block ends"""
         while True:
-            char = self.read_byte()
-            if char is None:
-                break
-            if char in (OPEN_TAG, CLOSE_TAG):
-                self.unread(char)
+            # plain finds for the two terminators beat a regex class scan
+            self.merge_buffer()
+            data, cursor = self.data, self.cursor
+            end   = data.find(b'<', cursor)
+            end   = len(data) if end < 0 else end
+            close = data.find(b'>', cursor, end)
+            end   = end if close < 0 else close
+            self.read_into(value, end)
+            if end < len(data) or not self.read_chunk():
                 break
-            value.append(char)
 
     def read_special(self, value: bytearray, end: bytes):
         """read special style/script tag to completion"""
-        buffer = bytearray()
-        while True:
-            char = self.read_byte()
-            if char is None:
-                break
-            buffer.append(char)
-            if buffer.endswith(end):
-                value.extend(buffer[:-len(end)])
-                self.unread(*end)
-                break
+        length = len(value)
+        if not self.read_before(value, end):
+            #NOTE: unterminated special content is discarded
+            del value[length:]
 
     def read_comment(self, value: bytearray):
         """read until end of comment tag"""
-        buffer = bytearray()
-        while True:
-            char = self.read_byte()
-            if char is None:
-                break
-            if char == DASH:
-                if value:
-                    buffer.append(char)
-                continue
-            if char == CLOSE_TAG and len(buffer) >= 2:
-                break
-            if buffer:
-                value.extend(buffer)
-                buffer.clear()
-            value.append(char)
-        #NOTE: remove initial - allowed into value buffer
-        if value[0] == '-':
-            value.pop(0)
+        # drop second dash of the comment opening collected w/ the token
+        if value == ONLY_DASH:
+            value.clear()
+        if self.read_before(value, COMMENT_END):
+            self.cursor   += len(COMMENT_END)
+            self.position += len(COMMENT_END)
 
     def read_delcaration(self, value: bytearray):
         """read declaration string"""
@@ -161,6 +164,7 @@ class Lexer(BaseLexer):
         """look ahead in data-stream to see if char is present"""
         found  = False
         buffer = bytearray()
+        lineno, position = self.lineno, self.position
         while True:
             char = self.read_byte()
             if char is None:
@@ -172,29 +176,30 @@ class Lexer(BaseLexer):
                 found = True
             break
         if not found:
-            self.buffer.extend(buffer)
+            self.pushback(bytes(buffer))
+            self.lineno, self.position = lineno, position
         return found
 
     def guess_token(self, char: int, value: bytearray) -> int:
         """guess token based on a single character"""
-        if char == OPEN_TAG:
-            return Token.TAG_START
-        elif char == SLASH and self.last_token != Token.TAG_END:
+        kind = CHAR_KINDS[char]
+        if 0 < kind < SLASH_KIND:
+            return kind
+        if kind == SLASH_KIND and self.last_token != TAG_END:
             if self.look_ahead(CLOSE_TAG):
-                return Token.TAG_CLOSE
-        elif char == CLOSE_TAG:
-            return Token.TAG_END
-        elif char == EQUALS and self.last_token == Token.ATTR_NAME:
+                return TAG_CLOSE
+        elif kind == EQUALS_KIND and self.last_token == ATTR_NAME:
             self.skip_spaces()
-            return Token.ATTR_VALUE
+            return ATTR_VALUE
         # parse according to additional context
-        if not self.last_token or Token.TAG_END <= self.last_token <= Token.INSTRUCTION:
+        last = self.last_token
+        if not last or TAG_END <= last <= INSTRUCTION:
             value.append(char)
-            return Token.TEXT
-        elif char not in SPACES:
+            return TEXT
+        elif kind != SPACE_KIND:
             value.append(char)
-            return Token.ATTR_NAME
-        return Token.UNDEFINED
+            return ATTR_NAME
+        return UNDEFINED
 
     def handle_text(self, value: bytearray):
         """handle text parsing when value is text"""
@@ -208,32 +213,34 @@ class Lexer(BaseLexer):
         """parse the next token from the raw incoming data"""
         char     = 0
         token    = 0
-        value    = bytearray()
+        value    = self.scratch
         lineno   = self.lineno
         position = self.position
+        # reuse a single scratch buffer for every token collected
+        value.clear()
         while True:
             char = self.read_byte()
             if char is None:
                 break
             # skip spaces if within tag definition
-            if char in SPACES and self.last_token < Token.TAG_END:
+            if char in SPACES and self.last_token < TAG_END:
                 continue
             # guess token based on single character
             if not token:
                 token = self.guess_token(char, value)
-                if token in (Token.TAG_END, Token.TAG_CLOSE, Token.TEXT):
+                if token in (TAG_END, TAG_CLOSE, TEXT):
                     break
                 continue
             # improve token guess for specific token-types
-            if token == Token.TAG_START:
+            if token == TAG_START:
                 if char == BANG:
-                    token = Token.DECLARATION
+                    token = DECLARATION
                     continue
                 if char == QUESTION:
-                    token = Token.INSTRUCTION
+                    token = INSTRUCTION
                     continue
-            if char == DASH and token == Token.DECLARATION:
-                token = Token.COMMENT
+            if char == DASH and token == DECLARATION:
+                token = COMMENT
                 continue
             # append character save for certain exceptions
             if char not in QUOTES:
@@ -242,37 +249,37 @@ class Lexer(BaseLexer):
             if token:
                 break
         # handle processing based on tag-type
-        if token == Token.TAG_START:
+        if token == TAG_START:
             self.read_tag(value)
             # correct for invalid tags
             if all(c in SPECIAL for c in value) or value.startswith(b' '):
-                token = Token.TEXT
+                token = TEXT
                 value.insert(0, OPEN_TAG)
                 value.append(ord(' '))
                 self.handle_text(value)
             else:
                 self.last_tag = bytes(value)
-        elif token == Token.ATTR_NAME:
+        elif token == ATTR_NAME:
             self.read_word(value)
             # correct for broken attributes
             if value and value[-1] == CLOSE_TAG:
                 value = value[:-1]
                 self.unread(CLOSE_TAG)
-        elif token == Token.ATTR_VALUE:
+        elif token == ATTR_VALUE:
             if char and char in QUOTES:
                 self.read_quote(char, value)
             else:
                 self.read_word(value)
-        elif token in (Token.TAG_END, Token.TAG_CLOSE):
-            pass
-        elif token == Token.TEXT:
-            self.handle_text(value)
-        elif token == Token.COMMENT:
-            self.read_comment(value)
-        elif token == Token.DECLARATION:
-            self.read_delcaration(value)
-        elif token == Token.INSTRUCTION:
-            self.read_instruction(value)
-        elif char is not None:
+        elif token in READERS:
+            READERS[token](self, value)
+        elif token == UNDEFINED and char is not None:
             raise ValueError('invalid character?', token, chr(char))
-        return Result(token, bytes(value), lineno, position)
+        return new_tuple(Result, (TOKENS[token], bytes(value), lineno, position))
+
+#: readers used to complete simple tokens once their type is known
+READERS = {
+    TEXT:        Lexer.handle_text,
+    COMMENT:     Lexer.read_comment,
+    DECLARATION: Lexer.read_delcaration,
+    INSTRUCTION: Lexer.read_instruction,
+}
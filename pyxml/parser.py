@@ -1,17 +1,18 @@
 """
 Abstracted Python XML Parser Implementation
 """
+import mmap
 import os
 import re
 from abc import abstractmethod
 from io import IOBase, BytesIO
 from dataclasses import dataclass, field
 from typing import (
-    BinaryIO, Dict, Iterator, List, Optional,
+    BinaryIO, Dict, Iterator, Optional,
     Protocol, Set, Tuple, Type, Union)
 
 from .lexer import DataStream, Token, Lexer, Result, BaseLexer
-from .builder import TreeBuilder
+from .builder import Event, EventBuilder, TreeBuilder
 from .element import Element
 from .escape import unescape
 
@@ -24,6 +25,12 @@ re_encoding = re.compile(r'encoding\s?=\s?([^\s,]+)', re.IGNORECASE)
 #: environment controlled variable for lang behavior
 FILE_CHUNK_SIZE = int(os.environ.get('PYXML_CHUNK_SIZE', '8192'))
 
+#: minimum file size before files are memory-mapped instead of streamed
+MMAP_MIN_SIZE = int(os.environ.get('PYXML_MMAP_MIN_SIZE', '65536'))
+
+#: chunk size used when streaming file contents into the lexer
+STREAM_CHUNK_SIZE = int(os.environ.get('PYXML_STREAM_CHUNK_SIZE', '65536'))
+
 #** Functions **#
 
 def chunk_file(f, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[bytes]:
@@ -34,10 +41,20 @@ def chunk_file(f, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[bytes]:
             break
         yield chunk
 
-def stream_file(f, chunk_size: int = 8192) -> Iterator[int]:
-    """stream bytes of file one at a time"""
-    for chunk in chunk_file(f, chunk_size):
-        yield from chunk
+def stream_file(f, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """stream large chunks of bytes from file to feed the lexer"""
+    while (chunk := f.read(chunk_size)):
+        yield chunk
+
+def map_file(f) -> Optional[mmap.mmap]:
+    """memory-map large on-disk files to read them w/o copying (if possible)"""
+    try:
+        fileno = f.fileno()
+        if os.fstat(fileno).st_size < MMAP_MIN_SIZE:
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        return None
 
 def write_parser(parser, data: Union[str, bytes, IOBase, BinaryIO]):
     """write a wide variety of content into parser"""
@@ -75,7 +92,7 @@ class BaseParser(Protocol):
     __slots__ = ('target', 'stream', 'buffer', 'lexer', 'lfactory')
 
     target:   TreeBuilder
-    stream:   Optional[DataStream]
+    stream:   Optional[Union[bytes, DataStream]]
     buffer:   Optional[IOBase]
     lexer:    Optional[Lexer]
     lfactory: Type[BaseLexer]
@@ -84,7 +101,7 @@ class BaseParser(Protocol):
         """
         set parser stream directly
 
-        :param stream: raw bytes data stream to parse into xml tree
+        :param stream: iterator of raw byte chunks (or single byte ints) to parse
         """
         if self.stream is not None:
             raise RuntimeError('data-stream already set')
@@ -128,22 +145,64 @@ class BaseParser(Protocol):
         """
         raise NotImplementedError
 
-    def close(self) -> Element:
+    def open_lexer(self) -> Optional[mmap.mmap]:
         """
-        stop consuming data from read buffer and parse existing content
+        assign data-stream based on internal state and spawn the lexer
 
-        :return: element-tree root parsed from raw data
+        :return: memory-mapped file backing the stream to close after parsing
         """
-        # assign stream based on internal state
+        mapped = None
         if self.stream is None:
             if self.buffer is None:
                 raise RuntimeError('no data-stream provided')
-            self.buffer.seek(0)
-            self.stream = stream_file(self.buffer)
-        # spawn lexer and complete parsing
+            # lexer indexes fed bytes directly w/o copying them into chunks
+            if isinstance(self.buffer, BytesIO):
+                self.stream = self.buffer.getvalue()
+            else:
+                self.buffer.seek(0)
+                # lexer scans mapped files directly as a single in-memory chunk
+                mapped      = map_file(self.buffer)
+                self.stream = stream_file(self.buffer) \
+                    if mapped is None else iter((mapped, ))
         self.lexer = Lexer(self.stream)
-        while self.next():
-            pass
+        # fed bytes are parsed only once just like an exhausted data-stream
+        if isinstance(self.stream, bytes):
+            self.stream = iter(())
+        return mapped
+
+    def iter_events(self) -> Iterator[Event]:
+        """
+        parse existing content yielding events w/o building an element tree
+
+        :return: iterator of (event, *values) tuples in document order
+        """
+        # swap in an event target only while iterating
+        original = self.target
+        target   = self.target = EventBuilder() #type: ignore
+        mapped   = None
+        try:
+            mapped = self.open_lexer()
+            while self.next():
+                yield from target.events
+                target.events.clear()
+        finally:
+            self.target = original
+            if mapped is not None:
+                mapped.close()
+
+    def close(self) -> Element:
+        """
+        stop consuming data from read buffer and parse existing content
+
+        :return: element-tree root parsed from raw data
+        """
+        mapped = self.open_lexer()
+        try:
+            while self.next():
+                pass
+        finally:
+            if mapped is not None:
+                mapped.close()
         return self.target.close()
 
 @dataclass(repr=False)
@@ -190,7 +249,7 @@ class Parser(BaseParser):
             return
         # process attributes on start-tag
         closed:     bool           = False
-        incomplete: List[str]      = []
+        pending:    Optional[str]  = None
         attributes: Dict[str, str] = {}
         while True:
             result = self.lexer.next()
@@ -205,10 +264,16 @@ class Parser(BaseParser):
                 break
             # handle attribute tags
             elif token == Token.ATTR_NAME:
-                incomplete.append(value)
+                # names w/o a value are boolean attributes
+                if pending is not None:
+                    attributes[pending] = 'true'
+                pending = value
                 continue
-            elif token == Token.ATTR_VALUE:
-                attributes[incomplete.pop()] = self.unescape(value)
+            elif token == Token.ATTR_VALUE and pending is not None:
+                # skip unescape call entirely when there are no references
+                attributes[pending] = \
+                    self.unescape(value) if '&' in value else value
+                pending = None
                 continue
             elif self.fix_broken and token == Token.TAG_START:
                 self.error = result
@@ -216,7 +281,8 @@ class Parser(BaseParser):
                 break
             raise ParserError('Unexpected Tag Token', result)
         # finalize processing for starting tag
-        attributes.update({k:'true' for k in incomplete})
+        if pending is not None:
+            attributes[pending] = 'true'
         if closed or (empty and tag in empty):
             if hasattr(self.target, 'startend'):
                 self.target.startend(tag, attributes)
@@ -255,7 +321,7 @@ class Parser(BaseParser):
         if token == Token.TAG_START:
             self.parse_tag(value)
         elif token == Token.TEXT:
-            self.target.data(self.unescape(value))
+            self.target.data(self.unescape(value) if '&' in value else value)
         elif token == Token.COMMENT:
             self.target.comment(self.unescape(value))
         elif token == Token.DECLARATION:
@@ -1,10 +1,13 @@
 """
 XML Builder Implementation Unit Tests
 """
+import copy
+import pickle
 import unittest
 from typing import List
 
 from ..builder import Element, TreeBuilder, BuilderError
+from ..etree import tostring
 
 #** Variables **#
 __all__ = ['BuilderTests']
@@ -84,3 +87,116 @@ class BuilderTests(unittest.TestCase):
         self.builder.end('li')
         self.builder.end('li')
         self.assertTags(self.builder.close(), ['ul', 'li'])
+
+    def test_intern_names(self):
+        """ensure repeated tag/attribute names share a single object"""
+        self.builder.start('ul', {})
+        for _ in range(2):
+            self.builder.start(''.join(['l', 'i']), {''.join(['i', 'd']): '1'})
+            self.builder.end('li')
+        self.builder.end('ul')
+        one, two = self.builder.close().children
+        self.assertIs(one.tag, two.tag)
+        self.assertIs(*[next(iter(e.attrib)) for e in (one, two)])
+
+    def test_attrib_copy(self):
+        """ensure elements never share a caller supplied attribute dict"""
+        attrib = {'id': '1'}
+        one, two = Element('li', attrib), Element('li', attrib)
+        one.set('id', '2')
+        self.assertEqual(two.get('id'), '1')
+        self.assertEqual(attrib, {'id': '1'})
+
+    def test_extend_parents(self):
+        """ensure extending w/ a generator assigns parents to all children"""
+        root = Element('ul')
+        root.extend(Element('li') for _ in range(3))
+        self.assertEqual(len(root), 3)
+        self.assertTrue(all(child.parent is root for child in root))
+
+    def test_iter_live(self):
+        """ensure iteration results follow tree modifications"""
+        root = Element('ul')
+        root.append(Element('li'))
+        self.assertTags(root, ['ul', 'li'])
+        root[0].append(Element('a'))
+        self.assertTags(root, ['ul', 'li', 'a'])
+        self.assertEqual(list(root.iter('a')), [root[0][0]])
+        root.append(Element('a'))
+        self.assertEqual(len(list(root.iter('a'))), 2)
+        root.remove(root[0])
+        self.assertTags(root, ['ul', 'a'])
+        self.assertEqual(list(root.iter('ul')), [root])
+        root[0].tag = 'b'
+        self.assertEqual(list(root.iter('a')), [])
+        self.assertEqual(list(root.iter('b')), [root[0]])
+        root.children.append(Element('a'))
+        self.assertTags(root, ['ul', 'b', 'a'])
+
+    def test_empty_text(self):
+        """ensure elements without any text content keep text unassigned"""
+        self.builder.start('ul', {})
+        self.builder.start('li', {})
+        self.builder.end('li')
+        self.builder.end('ul')
+        root = self.builder.close()
+        self.assertIsNone(root.text)
+        self.assertIsNone(root[0].text)
+        self.assertIsNone(root[0].tail)
+
+    def test_attrib_mutable(self):
+        """ensure elements without attributes can still be modified and copied"""
+        self.builder.start('ul', {})
+        self.builder.end('ul')
+        root = self.builder.close()
+        root.attrib['key'] = 'value'
+        self.assertEqual(root.get('key'), 'value')
+        self.assertEqual(copy.deepcopy(root).attrib, {'key': 'value'})
+        self.assertEqual(pickle.loads(pickle.dumps(Element('li'))).attrib, {})
+
+    def test_itertext(self):
+        """ensure text and tails are iterated in document order"""
+        self.builder.start('p', {})
+        self.builder.data('a')
+        self.builder.start('b', {})
+        self.builder.data('b')
+        self.builder.end('b')
+        self.builder.data('c')
+        self.builder.end('p')
+        root = self.builder.close()
+        self.assertListEqual(list(root.itertext()), ['a', 'b', 'c'])
+
+    def test_deep_tree(self):
+        """ensure deeply nested trees are walked/serialized w/o recursion"""
+        depth = 5000
+        for _ in range(depth):
+            self.builder.start('div', {})
+        self.builder.data('text')
+        for _ in range(depth):
+            self.builder.end('div')
+        root = self.builder.close()
+        self.assertEqual(len(list(root.iter())), depth)
+        self.assertListEqual(list(root.itertext()), ['text'])
+        output = tostring(root, xml_declaration='')
+        self.assertEqual(output, b'<div>' * depth + b'text' + b'</div>' * depth)
+
+    def test_empty_children(self):
+        """ensure leaf elements expose a mutable children list"""
+        self.builder.start('ul', {})
+        self.builder.start('li', {})
+        self.builder.end('li')
+        self.builder.end('ul')
+        leaf = self.builder.close()[0]
+        self.assertListEqual(leaf.getchildren(), [])
+        leaf.children.append(Element('a'))
+        self.assertEqual(len(leaf), 1)
+
+    def test_open_tag_cache(self):
+        """ensure cached opening tags follow direct tag/attribute edits"""
+        root = Element('ul', {'class': 'a'})
+        write = lambda: tostring(root, xml_declaration='', cache=True)
+        self.assertEqual(write(), b'<ul class="a"/>')
+        root.tag = 'ol'
+        self.assertEqual(write(), b'<ol class="a"/>')
+        root.attrib['class'] = 'b'
+        self.assertEqual(write(), b'<ol class="b"/>')
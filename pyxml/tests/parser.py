@@ -1,9 +1,10 @@
 """
 XML Parser Implementation Unit-Tests
 """
+import tempfile
 import unittest
 
-from ..parser import Element, Parser, ParserError
+from ..parser import MMAP_MIN_SIZE, Element, Parser, ParserError, TreeBuilder
 
 #** Variables **#
 __all__ = ['ParserTests']
@@ -181,6 +182,16 @@ class ParserTests(unittest.TestCase):
                 Element.new('script', {'type': 'text/javascript'}, text='console.log("<<\\"<><>{}[]))");')
         ]))
 
+    def test_unescape(self):
+        """ensure escaped references are only unescaped a single time"""
+        self.assertTree(b'<p attr="&amp;lt;&#65;">&amp;amp; &lt;b&gt;</p>',
+            Element.new('p', {'attr': '&lt;A'}, text='&amp; <b>'))
+
+    def test_escaped_quotes(self):
+        """ensure escaped quotes do not terminate attribute values"""
+        self.assertTree(b'<p one="x\\"y" two="z\\\\" three=\'\\\'\'/>',
+            Element.new('p', {'one': 'x\\"y', 'two': 'z\\\\', 'three': "\\'"}))
+
     def test_edgecase_comment(self):
         """ensure special instaclose comment edgecase does not raise errors"""
         self.assertTree(edgecase_comment,
@@ -191,3 +202,65 @@ class ParserTests(unittest.TestCase):
                 ])
             ])
         )
+
+    def test_chunked_stream(self):
+        """ensure tokens split across stream chunks are parsed correctly"""
+        size   = 3
+        chunks = [edgecase_script[n:n+size]
+            for n in range(0, len(edgecase_script), size)]
+        self.parser.set_stream(iter(chunks))
+        parsed = list(self.parser.close().iter())
+        self.parser = Parser()
+        self.parser.feed(edgecase_script)
+        expected = list(self.parser.close().iter())
+        self.assertEqual(len(parsed), len(expected))
+        for p, e in zip(parsed, expected):
+            self.assertEqual(p.tag, e.tag, 'tags do not match')
+            self.assertEqual(p.text, e.text, f'{p.tag} text mismatch')
+            self.assertEqual(p.attrib, e.attrib, f'{p.tag} attrib mismatch')
+
+    def test_close_twice(self):
+        """ensure closing again returns the same tree w/o parsing it twice"""
+        self.parser.feed(b'<a><b/></a>')
+        root = self.parser.close()
+        self.assertIs(self.parser.close(), root)
+        self.assertEqual(len(root), 1)
+
+    def test_int_stream(self):
+        """ensure legacy streams of single byte integers are still accepted"""
+        self.parser.set_stream(iter(b'<a id="1">text</a>'))
+        root = self.parser.close()
+        self.assertEqual(root.get('id'), '1')
+        self.assertEqual(root.text, 'text')
+        self.parser = Parser()
+        self.parser.set_stream(iter(['<a/>']))
+        with self.assertRaises(TypeError):
+            self.parser.close()
+
+    def test_iter_events(self):
+        """ensure parsing events are produced w/o building a tree"""
+        self.parser.feed(b'<a id="1"><b/>text<!--c-d--></a>')
+        self.assertListEqual(list(self.parser.iter_events()), [
+            ('start', 'a', {'id': '1'}),
+            ('start', 'b', {}),
+            ('end', 'b'),
+            ('data', 'text'),
+            ('comment', 'c-d'),
+            ('end', 'a'),
+        ])
+        self.assertIsInstance(self.parser.target, TreeBuilder)
+
+    def test_mapped_file(self):
+        """ensure large on-disk files parse the same when memory-mapped"""
+        item = b'<p class="item">Paragraph</p>\n'
+        xml  = b'<document>' + item * (MMAP_MIN_SIZE // len(item) + 1) + b'</document>'
+        with tempfile.TemporaryFile() as f:
+            f.write(xml)
+            self.parser.readfrom(f)
+            parsed = list(self.parser.close().iter())
+        self.assertTrue(self.parser.lexer.data.closed)
+        self.parser = Parser()
+        self.parser.feed(xml)
+        expected = list(self.parser.close().iter())
+        self.assertEqual(len(parsed), len(expected))
+        self.assertEqual(parsed[-1].tail, expected[-1].tail)
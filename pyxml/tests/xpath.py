@@ -3,7 +3,8 @@ XPath Engine Unit Tests
 """
 import unittest
 
-from .. import fromstring
+from .. import Element, ElementTree, fromstring
+from ..xpath.engine import clear_cache, compile_xpath
 
 #** Variables **#
 __all__ = ['XpathTests']
@@ -140,6 +141,14 @@ class XpathTests(unittest.TestCase):
         self.assertIsInstance(text[0], str)
         self.assertEqual(text[0].strip(), 'ARTICLE HEADER')
 
+    def test_translate(self):
+        """test `translate` maps and removes individual characters"""
+        root = fromstring(b'<div><p id="bca">abcabc-d</p></div>')
+        self.assertListEqual(
+            root.findall('//p/translate(text(), "abca", "AB")'), ['ABAB-d'])
+        self.assertListEqual(
+            root.findall('//p/translate(text(), @id, "xy")'), ['xyxy-d'])
+
     def test_get_attr(self):
         """test `@attribute` getter value retrieval"""
         classes = xml.findall('//span/@class')
@@ -160,6 +169,81 @@ class XpathTests(unittest.TestCase):
         self.assertEqual(len(finals), 6)
         self.assertListEqual(finals, [False, False, True, False, False, True])
 
+    def test_compare_expr(self):
+        """test comparison against nested expression results"""
+        spans = xml.findall('//span[position()=3]')
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(spans[0].get('class'), 'footer')
+        spans = xml.findall('//span[position()>0]')
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(spans[0].get('class'), 'footer')
+
+    def test_int_literal(self):
+        """test integer constants are compared as written"""
+        root = fromstring(b'<div><p num="05"/><p num="5"/></div>')
+        nums = lambda path: [e.get('num') for e in root.findall(path)]
+        self.assertListEqual(nums('//p[@num = 05]'), ['05'])
+        self.assertListEqual(nums('//p[@num < 06]'), ['05', '5'])
+
+    def test_lazy_logic(self):
+        """test logical operators skip evaluating an unneeded second argument"""
+        root = fromstring(b'<div><p class="p1"/><p class="p1"/></div>')
+        self.assertEqual(len(root.findall('//p[@class="p1" or (@class < 2)]')), 2)
+        self.assertListEqual(root.findall('//p[@class="p2" and (@class < 2)]'), [])
+        with self.assertRaises(ValueError):
+            root.findall('//p[@class="p2" or (@class < 2)]')
+
+    def test_int_compare(self):
+        """test integer comparisons between attributes and constants"""
+        root = fromstring(b'<div><p num="1"/><p num="5"/><p num="10"/></div>')
+        nums = lambda path: [e.get('num') for e in root.findall(path)]
+        self.assertListEqual(nums('//p[@num < 5]'), ['1'])
+        self.assertListEqual(nums('//p[@num >= 5]'), ['5', '10'])
+        self.assertListEqual(nums('//p[6 > @num]'), ['1', '5'])
+        self.assertListEqual(nums('//p[2 <= 1]'), [])
+
+    def test_count_words(self):
+        """test bare words are valid function arguments"""
+        root = fromstring(b'<div><p><b/></p><p/></div>')
+        self.assertEqual(len(root.findall('//div[count(p) = 2]')), 1)
+        # expression results keep their native type rather than a string
+        self.assertListEqual(root.findall('//div/count(p)'), [2])
+        self.assertEqual(len(root.findall('//p[count(b) = 1]')), 1)
+
+    def test_not_equals(self):
+        """test inequality operator words compile as expression arguments"""
+        root = fromstring(b'<div><p ident="x"/><p ident="x"/></div>')
+        self.assertListEqual(root.findall('//p[@ident != "x"]'), [])
+
+    def test_position_mutation(self):
+        """test cached child positions follow tree modifications"""
+        root = fromstring(b'<div><p>A</p><p>B</p></div>')
+        self.assertListEqual(root.findall('//p/position()'), [0, 1])
+        root.insert(0, Element('p'))
+        self.assertListEqual(root.findall('//p/position()'), [0, 1, 2])
+        self.assertEqual(root.index(root[2]), 2)
+        root.append(root[0])
+        self.assertEqual(root.index(root[3]), 0)
+
+    def test_compile_cache(self):
+        """test compiled xpath expressions are cached until cleared"""
+        compiled = compile_xpath(b'//p[@class="p1"]')
+        self.assertIs(compile_xpath(b'//p[@class="p1"]'), compiled)
+        clear_cache()
+        self.assertIsNot(compile_xpath(b'//p[@class="p1"]'), compiled)
+        self.assertTrue(xml.findall('//p[@class="p1"]'))
+        # identical filters are shared between different xpaths
+        first  = compile_xpath(b'//p[@class="p1"]')
+        second = compile_xpath(b'//div/p[@class="p1"]')
+        self.assertIs(first[-1][1], second[-1][1])
+
+    def test_reindex_parents(self):
+        """test parent-axis functions work after reindexing manual trees"""
+        root = Element.new('div', children=[Element('p'), Element('p')])
+        self.assertListEqual(root.findall('//p/position()'), [0, 0])
+        ElementTree(root).reindex_parents()
+        self.assertListEqual(root.findall('//p/position()'), [0, 1])
+
     def test_complex_child(self):
         """test complex child retrieval works as intended"""
         children = xml.findall('//article[@class="message-body"]/[1]/p[contains(text(), "Final")]')
@@ -3,11 +3,11 @@ XML Xpath Query-Language Implementation
 """
 from typing import Iterator, Optional, List, Any
 
-from .engine import iter_xpath
+from .engine import clear_cache, iter_xpath
 from ..element import Element
 
 #** Variables **#
-__all__ = ['iterfind', 'find', 'findall', 'findtext']
+__all__ = ['clear_cache', 'iterfind', 'find', 'findall', 'findtext']
 
 #** Functions **#
 
@@ -2,8 +2,10 @@
 XPATH Processing Engine
 """
 import re
+import sys
+from functools import lru_cache
 from typing import (
-    Any, Iterator, List, Literal, Optional, Sequence, Tuple, overload)
+    Any, Callable, Iterator, List, Literal, Optional, Sequence, Tuple, overload)
 
 from .lexer import XToken, XLexer, EToken, ELexer
 from .functions import *
@@ -11,60 +13,73 @@ from ..element import Element
 from .._tokenize import Result
 
 #** Variables **#
-__all__ = ['iter_xpath']
+__all__ = ['clear_cache', 'compile_xpath', 'iter_xpath']
 
 #: type hint for list of argument getters
 Args = List[ArgGetter]
 
-#: regex expression to match variable string
-re_var = re.compile(r'^@\w+$')
+#: type hint for single pre-processed xpath action
+Action = Tuple[XToken, Any]
 
-#** Functions **#
+#: type hint for compiled expression components
+Compiled = Tuple[Args, Optional[Result], EvalExpr]
 
-def filter_tag(elements: List[Element], tag: str) -> List[Element]:
-    """only return element if it matches the specified tag"""
-    return [e for e in elements if e.tag == tag]
+#: type hint for xpath step handler
+Handler = Callable[[List[Any], Any], List[Any]]
+
+#: regex expression to match variable string (allowing utf-8 encoded names)
+re_var = re.compile(rb'^@[\w\x80-\xff]+$')
+
+#: compilation kinds for expression tokens
+ARGUMENT, GROUP, SEPARATOR, OPERATOR = range(1, 5)
+
+#: compilation kind of each expression token (indexed by token value)
+EXPR_KINDS = tuple(
+    OPERATOR  if token >= EToken.EQUALS else
+    ARGUMENT  if token <= EToken.VARIABLE else
+    GROUP     if token == EToken.EXPRESSION else
+    SEPARATOR if token == EToken.COMMA else 0
+    for token in range(max(EToken) + 1))
+
+#: action used for integer-only filter expressions
+INDEX_ACTION = Result(EToken.FUNCTION, b'index', 0, 0)
 
-def get_parent(element: Element, parents: int) -> Optional[Element]:
-    """retrieve parent elements from orignal element"""
-    for _ in range(0, parents):
-        if element.parent is None:
-            return
-        element = element.parent
-    return element
+#: action used for variable-only filter expressions
+NOTEMPTY_ACTION = Result(EToken.FUNCTION, b'notempty', 0, 0)
 
-def compile_expr(expr: bytes, pure: bool = True) -> Tuple[Args, Optional[Result], EvalExpr]:
+#: maximum number of compiled xpath expressions to keep cached
+CACHE_SIZE = 256
+
+#** Functions **#
+
+def compile_expr(expr: bytes, pure: bool = True) -> Compiled:
     """compile a valid xpath filter expression"""
     # generate context for compiling expression
-    lexer = ELexer(iter(expr))
+    lexer = ELexer(expr)
     args: Args = []
     action: Optional[Result] = None
     compiled: EvalExpr = lambda _: False
     # modify action for special behaviors
     if expr.isdigit():
-        action = Result(EToken.FUNCTION, b'index', 0, 0)
-    if pure and re_var.match(expr.decode()):
-        action = Result(EToken.FUNCTION, b'notempty', 0, 0)
+        action = INDEX_ACTION
+    elif pure and re_var.match(expr):
+        action = NOTEMPTY_ACTION
     # parse expression according to lexer bytes
     while True:
         # retrieve next action in expression
         result = lexer.next()
         if result is None:
             break
-        # handle according to token
-        token, value, _, _ = result
-        if token >= EToken.EQUALS:
+        # handle according to token kind
+        kind = EXPR_KINDS[result.token]
+        if kind == OPERATOR:
             action = result
             continue
-        elif token <= EToken.VARIABLE:
-            arg = compile_argument(result)
-            args.append(arg)
-        elif token == EToken.EXPRESSION:
-            expr_args = compile_expr_args(value, pure)
-            args.extend(expr_args)
-        elif token == EToken.COMMA:
-            pass
-        else:
+        elif kind == ARGUMENT:
+            args.append(compile_argument(result))
+        elif kind == GROUP:
+            args.extend(compile_expr_args(result.value, pure))
+        elif kind != SEPARATOR:
             raise ValueError('unsupported action?', result)
         # process action when specified
         if action:
@@ -82,13 +97,53 @@ def compile_expr_args(expr: bytes, pure: bool = True) -> Args:
         raise ValueError('invalid arguments', action, args)
     return args
 
+@lru_cache(maxsize=CACHE_SIZE)
 def compile_expr_func(expr: bytes, pure: bool = True) -> EvalExpr:
-    """compile a complete filter expression into a single function"""
+    """compile a complete filter expression into a single function (cached)"""
     args, action, compiled = compile_expr(expr, pure)
     if action and args:
         raise ValueError('incomplete expression', action, args)
     return compiled
 
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_xpath(xpath: bytes) -> Tuple[Action, ...]:
+    """
+    compile xpath into a series of actions w/ pre-processed values (cached)
+
+    :param xpath: raw xpath expression
+    :return:      tuple of token/value pairs to evaluate in order
+    """
+    actions: List[Action] = []
+    for action in XLexer(xpath).iter():
+        token, value, _, _ = action
+        if token in (XToken.CHILD, XToken.DECENDANT):
+            actions.append((token, None))
+        elif token == XToken.NODE:
+            tag = sys.intern(value.decode())
+            # fuse tag filter into the preceding child/decendant walk
+            if actions and actions[-1][1] is None \
+                and actions[-1][0] in (XToken.CHILD, XToken.DECENDANT):
+                actions[-1] = (actions[-1][0], tag)
+                continue
+            actions.append((token, tag))
+        elif token in (XToken.WILDCARD, XToken.SELF):
+            continue
+        elif token == XToken.PARENT:
+            actions.append((token, len(value)))
+        elif token in (XToken.FILTER, XToken.FUNCTION):
+            actions.append((token, compile_expr_func(value)))
+        elif token == XToken.EXPRESSION:
+            actions.append((token, compile_expr(value, False)))
+        else:
+            raise ValueError('unsupported token', action)
+    return tuple(actions)
+
+def clear_cache():
+    """clear cache of compiled xpath expressions"""
+    compile_xpath.cache_clear()
+    compile_expr_func.cache_clear()
+    compile_argument.cache_clear()
+
 @overload
 def iter_xpath(xpath: bytes,
     elems: Sequence[Element], pure: Literal[True] = True) -> Iterator[Element]:
@@ -109,43 +164,80 @@ def iter_xpath(xpath: bytes,
     :param pure:     avoid returning non-element values when true
     :return:         iterator of elements matching xpath criteria
     """
-    lexer    = XLexer(iter(xpath))
-    elements = list(elems)
-    values   = None #type: Optional[List[Any]]
-    for action in lexer.iter():
+    elements  = list(elems)
+    evaluated = False
+    for token, value in compile_xpath(xpath):
         # process action according to token-type
-        token, value, _, _ = action
-        if values:
+        if evaluated and elements:
             raise ValueError('cannot traverse elemtree after expression', value)
-        elif token == XToken.CHILD:
-            elements = [c for e in elements for c in e]
-        elif token == XToken.DECENDANT:
-            elements = [c for e in elements for c in e.iter()]
-        elif token == XToken.NODE:
-            elements = filter_tag(elements, value.decode())
-        elif token in (XToken.WILDCARD, XToken.SELF):
-            continue
-        elif token == XToken.PARENT:
-            parents  = (get_parent(e, len(value)) for e in elements)
-            elements = [p for p in parents if p is not None]
-        elif token == XToken.FILTER:
-            expr     = compile_expr_func(value)
-            elements = [e for e in elements if expr(e)]
-        elif pure and token in (XToken.EXPRESSION, XToken.FUNCTION):
-            raise ValueError(f'toplevel {token.name} disallowed', value)
-        elif token == XToken.EXPRESSION:
-            values             = elements if values is None else values
-            args, action, func = compile_expr(value, False)
-            # process as a getter if no action, else process like a function
-            if action and func:
-                values = [func(v) for v in values]
-            elif not action:
-                getter = args[0]
-                values = [get_value(getter(v)) for v in values]
-        elif token == XToken.FUNCTION:
-            values = elements if values is None else values
-            expr   = compile_expr_func(value)
-            values = [expr(v) for v in values]
+        if token in (XToken.EXPRESSION, XToken.FUNCTION):
+            if pure:
+                raise ValueError(f'toplevel {token.name} disallowed', value)
+            evaluated = True
+        elements = HANDLERS[token](elements, value)
+    return iter(elements)
+
+## Step Handlers
+
+def child_step(elements: List[Element], tag: Optional[str]) -> List[Element]:
+    """retrieve children of all elements (matching tag if given)"""
+    if tag is None:
+        return [c for e in elements for c in e.children]
+    return [c for e in elements for c in e.children if c.tag == tag]
+
+def decendant_step(elements: List[Element], tag: Optional[str]) -> List[Element]:
+    """retrieve all decendants of all elements (matching tag if given)"""
+    found = []
+    for elem in elements:
+        stack = [elem]
+        while stack:
+            elem = stack.pop()
+            if tag is None or elem.tag == tag:
+                found.append(elem)
+            stack.extend(reversed(elem.children))
+    return found
+
+def node_step(elements: List[Element], tag: str) -> List[Element]:
+    """retrieve elements matching the specified tag"""
+    return [e for e in elements if e.tag == tag]
+
+def parent_step(elements: List[Element], count: int) -> List[Element]:
+    """retrieve ancestor a number of levels above each element"""
+    parents = []
+    for parent in elements:
+        for _ in range(count):
+            parent = parent.parent
+            if parent is None:
+                break
         else:
-            raise ValueError('unsupported token', action)
-    return iter(values or elements)
+            parents.append(parent)
+    return parents
+
+def filter_step(elements: List[Element], expr: EvalExpr) -> List[Element]:
+    """retrieve elements matching filter expression"""
+    return [e for e in elements if expr(e)]
+
+def function_step(elements: List[Element], expr: EvalExpr) -> List[Any]:
+    """evaluate function against all elements"""
+    return [expr(e) for e in elements]
+
+def expression_step(elements: List[Element], compiled: Compiled) -> List[Any]:
+    """evaluate expression against all elements"""
+    args, action, func = compiled
+    # process as a getter if no action, else process like a function
+    if action:
+        return [func(e) for e in elements]
+    getter = args[0]
+    return [get_value(getter(e)) for e in elements]
+
+#** Init **#
+
+#: xpath step handlers indexed by token-type
+HANDLERS: List[Handler] = [None] * (max(XToken) + 1) #type: ignore
+HANDLERS[XToken.CHILD]      = child_step
+HANDLERS[XToken.DECENDANT]  = decendant_step
+HANDLERS[XToken.NODE]       = node_step
+HANDLERS[XToken.PARENT]     = parent_step
+HANDLERS[XToken.FILTER]     = filter_step
+HANDLERS[XToken.FUNCTION]   = function_step
+HANDLERS[XToken.EXPRESSION] = expression_step
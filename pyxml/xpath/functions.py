@@ -1,8 +1,10 @@
 """
 XPath Expression/Filter Functions
 """
-from functools import wraps
-from typing import Callable, List, NamedTuple, Union, cast
+import operator
+from functools import lru_cache, wraps
+from typing import (
+    Any, Callable, Dict, List, Optional, Union, cast)
 
 from .lexer import EToken
 from ..element import Element
@@ -24,31 +26,45 @@ __all__ = [
 EvalExpr = Callable[[Element], Union[int, bool, str]]
 
 #: argument value typehint
-class ArgValue(NamedTuple):
-    result: Result
-    value:  str
+class ArgValue:
+    __slots__ = ('result', 'value')
+
+    def __init__(self, result: Result, value: Any):
+        self.result = result
+        self.value  = value
+
+    def __repr__(self) -> str:
+        return f'ArgValue(result={self.result!r}, value={self.value!r})'
 
 #: argument getter function
 ArgGetter = Callable[[Element], ArgValue]
 
+#: maximum number of compiled argument getters to keep cached
+CACHE_SIZE = 512
+
 #** Utilities **#
 
 def wrap_expr(action: Result, expr: EvalExpr) -> ArgGetter:
     """wrap evaluate expression to act as an argument for later evaluation"""
+    # synthesize typed results so consumers can skip re-parsing raw values
+    results = {
+        bool: action._replace(token=EToken.BOOLEAN),
+        int:  action._replace(token=EToken.INTEGER),
+        str:  action._replace(token=EToken.STRING),
+    }
     @wraps(expr)
     def expr_getter(e: Element) -> ArgValue:
-        # run expression and convert type back to bytes
-        raw = expr(e)
-        if isinstance(raw, bool):
-            value = 'true' if raw else 'false'
-        elif isinstance(raw, int):
-            value = str(raw)
-        elif isinstance(raw, str):
-            value = raw
-        else:
-            raise ValueError('unexpected expression result', action, raw)
-        # return valid argument value
-        return ArgValue(action, value)
+        # run expression and pass raw value along w/ its matching type
+        raw    = expr(e)
+        result = results.get(type(raw))
+        if result is not None:
+            return ArgValue(result, raw)
+        # fallback to slower checks for subclasses of supported types
+        for cls, result in results.items():
+            if isinstance(raw, cls):
+                return ArgValue(result, raw)
+        raise ValueError('unexpected expression result', action, raw)
+    expr_getter.action = action
     return expr_getter
 
 def compile_action(action: Result, args: List[ArgGetter]) -> EvalExpr:
@@ -59,44 +75,192 @@ def compile_action(action: Result, args: List[ArgGetter]) -> EvalExpr:
         func = FUNCTIONS.get(action.value)
     if func is None:
         raise ValueError('unsupported func', action)
-    # generate dynamic function
-    @wraps(func)
-    def wrapper(e: Element) -> bool:
-        values = [getter(e) for getter in args]
-        return func(e, *values)
-    return wrapper
-
+    # generate fused function for simple attribute comparisons
+    if func is compare_eq:
+        fused = compile_attr_eq(args)
+        if fused is not None:
+            return wraps(func)(fused)
+    if func is contains:
+        fused = compile_text_contains(args)
+        if fused is not None:
+            return wraps(func)(fused)
+    if func in (contains, starts_with, ends_with):
+        fused = compile_constant_match(func, args)
+        if fused is not None:
+            return wraps(func)(fused)
+    if func in INT_OPERATORS:
+        fused = compile_int_compare(INT_OPERATORS[func], args)
+        if fused is not None:
+            return wraps(func)(fused)
+    if func is translate:
+        fused = compile_translate(args)
+        if fused is not None:
+            return wraps(func)(fused)
+    # evaluate the second argument of logical operators only when required
+    if func is compare_and and len(args) == 2:
+        one, two = args
+        return wraps(func)(
+            lambda e: bool(get_value(one(e)) and get_value(two(e))))
+    if func is compare_or and len(args) == 2:
+        one, two = args
+        return wraps(func)(
+            lambda e: bool(get_value(one(e)) or get_value(two(e))))
+    # generate dynamic function specialized by argument count
+    if not args:
+        wrapper = lambda e: func(e)
+    elif len(args) == 1:
+        one, = args
+        wrapper = lambda e: func(e, one(e))
+    elif len(args) == 2:
+        one, two = args
+        wrapper = lambda e: func(e, one(e), two(e))
+    elif len(args) == 3:
+        one, two, three = args
+        wrapper = lambda e: func(e, one(e), two(e), three(e))
+    else:
+        wrapper = lambda e: func(e, *[getter(e) for getter in args])
+    return wraps(func)(wrapper)
+
+@lru_cache(maxsize=CACHE_SIZE)
 def compile_argument(arg: Result) -> ArgGetter:
-    """compile argument collector function"""
-    def getter(e: Element) -> ArgValue:
-        # assign value
-        token, value, _, _ = arg
-        value        = value.decode()
-        if token == EToken.VARIABLE:
-            val = e.attrib.get(value, '')
-        else:
-            val = value
-        # assert value matches token and return arg-value
-        if token == EToken.INTEGER and not value.isdigit():
+    """compile argument collector function (specialized by token-type)"""
+    token, raw, _, _ = arg
+    value = raw.decode()
+    if token == EToken.VARIABLE:
+        def getter(e: Element) -> ArgValue:
+            return ArgValue(arg, e.attrib.get(value, ''))
+    elif token == EToken.INTEGER and not value.isdigit():
+        def getter(e: Element) -> ArgValue:
             raise ValueError('invalid integer', arg)
-        return ArgValue(arg, val)
+    else:
+        # constant arguments are evaluated once and re-used for every element
+        const = ArgValue(arg, value)
+        def getter(e: Element) -> ArgValue:
+            return const
     getter.__qualname__ = f'Getter[{arg.token!r},{arg.value!r}]'
+    getter.result       = arg
     return getter
 
+def compile_attr_eq(args: List[ArgGetter]) -> Optional[EvalExpr]:
+    """compile attribute equality check into a single closure if possible"""
+    if len(args) != 2:
+        return None
+    one, two = (getattr(getter, 'result', None) for getter in args)
+    if one is None or two is None:
+        return None
+    # ensure variable is always the first argument
+    if one.token != EToken.VARIABLE:
+        one, two = two, one
+    if one.token != EToken.VARIABLE:
+        return None
+    key = one.value.decode()
+    if two.token == EToken.STRING:
+        value = two.value.decode()
+        return lambda e: e.attrib.get(key, '') == value
+    if two.token == EToken.VARIABLE:
+        other = two.value.decode()
+        return lambda e: e.attrib.get(key, '') == e.attrib.get(other, '')
+    return None
+
+def compile_text_contains(args: List[ArgGetter]) -> Optional[EvalExpr]:
+    """compile `contains(text(), "...")` into a single closure if possible"""
+    if len(args) != 2:
+        return None
+    one = getattr(args[0], 'action', None)
+    two = getattr(args[1], 'result', None)
+    if one is None or one.token != EToken.FUNCTION or one.value != b'text':
+        return None
+    if two is None or two.token != EToken.STRING:
+        return None
+    needle = two.value.decode()
+    return lambda e: needle in text(e)
+
+def compile_constant_match(func: Callable,
+    args: List[ArgGetter]) -> Optional[EvalExpr]:
+    """compile string matching against a constant needle into a single closure"""
+    if len(args) != 2:
+        return None
+    two = getattr(args[1], 'result', None)
+    if two is None or two.token != EToken.STRING:
+        return None
+    one, needle = args[0], two.value.decode()
+    if func is contains:
+        return lambda e: needle in get_str(one(e))
+    if func is starts_with:
+        return lambda e: get_str(one(e)).startswith(needle)
+    return lambda e: get_str(one(e)).endswith(needle)
+
+def compile_int_compare(op: Callable[[int, int], bool],
+    args: List[ArgGetter]) -> Optional[EvalExpr]:
+    """compile integer comparisons of attributes/constants into a closure"""
+    if len(args) != 2:
+        return None
+    one, two = (getattr(getter, 'result', None) for getter in args)
+    if one is None or two is None:
+        return None
+    kinds = (one.token, two.token)
+    if kinds == (EToken.INTEGER, EToken.INTEGER):
+        result = op(int(one.value), int(two.value))
+        return lambda _: result
+    if kinds == (EToken.VARIABLE, EToken.INTEGER):
+        key, const = one.value.decode(), int(two.value)
+        return lambda e: op(attr_int(e, key, one), const)
+    if kinds == (EToken.INTEGER, EToken.VARIABLE):
+        key, const = two.value.decode(), int(one.value)
+        return lambda e: op(const, attr_int(e, key, two))
+    return None
+
+def attr_int(e: Element, key: str, arg: Result) -> int:
+    """retrieve integer value of the specified attribute"""
+    value = e.attrib.get(key, '')
+    if not value.isdigit():
+        raise ValueError('invalid integer', ArgValue(arg, value))
+    return int(value)
+
+def compile_translate(args: List[ArgGetter]) -> Optional[EvalExpr]:
+    """compile `translate` w/ constant characters into a prebuilt table"""
+    if len(args) != 3:
+        return None
+    base, src, dst = args
+    one, two = (getattr(getter, 'result', None) for getter in (src, dst))
+    if one is None or one.token != EToken.STRING:
+        return None
+    if two is None or two.token != EToken.STRING:
+        return None
+    table = translate_table(one.value.decode(), two.value.decode())
+    return lambda e: get_str(base(e)).translate(table)
+
+def get_str(arg: ArgValue) -> str:
+    """retrieve string value from argument-value"""
+    value = arg.value
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
 def get_int(arg: ArgValue) -> int:
     """retrieve integer value from argument-value"""
-    if not arg.value.isdigit():
+    value = arg.value
+    if type(value) is int:
+        return value
+    if not isinstance(value, str) or not value.isdigit():
         raise ValueError('invalid integer', arg)
-    return int(arg.value)
+    return int(value)
 
 def get_bool(arg: ArgValue) -> bool:
     """retrieve boolean value from argument-value"""
-    if arg.value not in ('0', '1', 'true', 'false'):
+    if isinstance(arg.value, bool):
+        return arg.value
+    value = get_str(arg)
+    if value not in ('0', '1', 'true', 'false'):
         raise ValueError('invalid boolean', arg)
-    return arg.value in ('1', 'true')
+    return value in ('1', 'true')
 
 def get_value(arg: ArgValue) -> Union[bool, int, str]:
     """retrieve python value for arg-value"""
+    if not isinstance(arg.value, str):
+        return arg.value
     if arg.result.token in (EToken.VARIABLE, EToken.STRING):
         return arg.value
     if arg.result.token == EToken.INTEGER:
@@ -109,7 +273,9 @@ def get_value(arg: ArgValue) -> Union[bool, int, str]:
 
 def compare_eq(_: Element, one: ArgValue, two: ArgValue) -> bool:
     """basic equal comparison"""
-    return one.value == two.value
+    if type(one.value) is type(two.value):
+        return one.value == two.value
+    return get_str(one) == get_str(two)
 
 def compare_or(_: Element, one: ArgValue, two: ArgValue) -> bool:
     """basic OR comparison"""
@@ -142,7 +308,7 @@ def index(e: Element, idx: ArgValue) -> bool:
     index  = get_int(idx)
     actual = 0
     if e.parent is not None:
-        actual = e.parent.children.index(e) + 1
+        actual = e.parent.index(e) + 1
     return actual == index
 
 def notempty(_: Element, var: ArgValue) -> bool:
@@ -157,22 +323,22 @@ def name(e: Element) -> str:
 
 def text(e: Element) -> str:
     """XPATH `text` function implementation"""
-    text = e.text or ''
-    for child in e.children:
-        if child.tail:
-            text += ' ' + child.tail
-    return text
+    tails = [child.tail for child in e.children if child.tail]
+    if not tails:
+        return e.text or ''
+    return ' '.join([e.text or '', *tails])
 
 def count(e: Element, tag: ArgValue) -> int:
-    """XPATH `count` function implementation"""
-    return sum(c.tag == tag.value for c in e.children)
+    """XPATH `count` function implementation (an int, like `position`)"""
+    return [c.tag for c in e.children].count(tag.value)
 
 def position(e: Element) -> int:
     """XPATH `position` function implementation"""
     if e.parent is not None:
-        for n, elem in enumerate(e.parent.children, 0):
-            if elem == e:
-                return n
+        try:
+            return e.parent.index(e)
+        except ValueError:
+            pass
     return 0
 
 ## Boolean Functions
@@ -185,55 +351,64 @@ def not_eq(_: Element, one: ArgValue) -> bool:
 
 def contains(_: Element, one: ArgValue, two: ArgValue) -> bool:
     """XPATH `contains` function implentation"""
-    return two.value in one.value
+    return get_str(two) in get_str(one)
 
 def starts_with(_: Element, one: ArgValue, two: ArgValue) -> bool:
     """XPATH `starts-with` function implementation"""
-    return one.value.startswith(two.value)
+    return get_str(one).startswith(get_str(two))
 
 def ends_with(_: Element, one: ArgValue, two: ArgValue) -> bool:
     """XPATH `ends-with` function implementation"""
-    return one.value.endswith(two.value)
+    return get_str(one).endswith(get_str(two))
 
 def concat(_: Element, one: ArgValue, two: ArgValue) -> str:
     """XPATH `concat` function implementation"""
-    return one.value + two.value
+    return get_str(one) + get_str(two)
 
 def substring(_: Element, b: ArgValue, s: ArgValue, e: ArgValue) -> str:
     """XPATH `substring` function implementation"""
-    return b.value[get_int(s):get_int(e)]
+    return get_str(b)[get_int(s):get_int(e)]
 
 def substring_before(_: Element, base: ArgValue, sub: ArgValue) -> str:
     """XPATH `substring-before` function implementation"""
-    index = base.value.find(sub.value)
-    index = index if index >= 0 else len(base.value)
-    return base.value[:index]
+    value = get_str(base)
+    index = value.find(get_str(sub))
+    index = index if index >= 0 else len(value)
+    return value[:index]
 
 def substring_after(_: Element, base: ArgValue, sub: ArgValue) -> str:
     """XPATH `substring-after` function implementation"""
-    index = base.value.find(sub.value)
-    index = index if index >= 0 else len(base.value)
-    return base.value[index:]
+    value = get_str(base)
+    index = value.find(get_str(sub))
+    index = index if index >= 0 else len(value)
+    return value[index:]
+
+def translate_table(src: str, dst: str) -> Dict[int, Optional[str]]:
+    """build translation table replacing src characters w/ dst characters"""
+    # first occurence wins and characters w/o replacement are removed
+    table: Dict[int, Optional[str]] = {}
+    for n, char in enumerate(src):
+        table.setdefault(ord(char), dst[n] if n < len(dst) else None)
+    return table
 
 def translate(_: Element, base: ArgValue, b: ArgValue, a: ArgValue) -> str:
     """XPATH `translate` fucntion implementation"""
-    return base.value.replace(b.value, a.value)
+    return get_str(base).translate(translate_table(get_str(b), get_str(a)))
 
 def lower_case(_: Element, v: ArgValue) -> str:
     """XPATH `lower-case` function implementation"""
-    return v.value.lower()
+    return get_str(v).lower()
 
 def upper_case(_: Element, v: ArgValue) -> str:
     """XPATH `upper-case` function implementation"""
-    return v.value.upper()
+    return get_str(v).upper()
 
 ## Axis Functions
 
 def last(e: Element) -> bool:
     """XPATH `last` function implementation"""
     if e.parent is not None:
-        children = e.parent.children
-        return children.index(e) == len(children) - 1
+        return e.parent.index(e) == len(e.parent.children) - 1
     return True
 
 #** Init **#
@@ -249,6 +424,14 @@ BUILTIN = {
     EToken.GTE:    compare_gte,
 }
 
+#: map of integer comparison functions to their operator equivalents
+INT_OPERATORS = {
+    compare_lt:  operator.lt,
+    compare_lte: operator.le,
+    compare_gt:  operator.gt,
+    compare_gte: operator.ge,
+}
+
 #: map of XPATH supported functions assigned by name
 FUNCTIONS = {
     b'index':            index,
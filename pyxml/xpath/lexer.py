@@ -1,6 +1,7 @@
 """
 XPATH Search Syntax Lexer
 """
+import re
 import string
 from enum import IntEnum
 from typing import Optional
@@ -36,6 +37,15 @@ FUNC = b'()'
 DIGIT = string.digits.encode()
 WORD = string.ascii_letters.encode() + DIGIT + b'_'
 
+#: regex to find special characters within a filter
+re_filter = re.compile(rb'[\]"\']')
+
+#: regex to find special characters within a toplevel expression
+re_expression = re.compile(rb'[\s"\'()\[\]]')
+
+#: regex to find special characters within a function expression
+re_func_expression = re.compile(rb'["\'()]')
+
 #** Classes **#
 
 class XToken(IntEnum):
@@ -67,22 +77,31 @@ class EToken(IntEnum):
     AND        = 13
     OR         = 14
 
+#: expression tokens that are known from a single byte (else zero)
+SINGLE_ETOKENS = tuple(
+    EToken.COMMA  if char == COMMA       else
+    EToken.EQUALS if char == EQUALS      else
+    EToken.LT     if char == LESSTHAN    else
+    EToken.GT     if char == GREATERTHAN else 0
+    for char in range(256))
+
 class XLexer(BaseLexer):
-    """XPath Path Lexer"""
+    """XPath Path Lexer (expects complete xpath bytes)"""
 
     def read_filter(self, value: bytearray):
         """
         read contents of filter until complete
         """
         while True:
+            # copy everything up until the next special character
+            self.read_into(value, self.search(re_filter))
             # break if empty or end of bracket
             char = self.read_byte()
             if char is None or char == CLOSE_BRACK:
                 break
             # skip quotes
-            if char in QUOTES:
-                value.append(char)
-                self.read_quote(char, value)
+            value.append(char)
+            self.read_quote(char, value)
             value.append(char)
 
     def read_expression(self, value: bytearray):
@@ -91,6 +110,7 @@ class XLexer(BaseLexer):
         """
         parens = []
         while True:
+            self.read_into(value, self.search(re_expression))
             char = self.read_byte()
             if char is None:
                 break
@@ -127,7 +147,7 @@ class XLexer(BaseLexer):
             elif char in b'\'"@(':
                 found = True
                 break
-        self.buffer.extend(buffer)
+        self.unread(*buffer)
         return found
 
     def _next(self) -> Result:
@@ -197,7 +217,7 @@ class XLexer(BaseLexer):
         return Result(token, bytes(value), 0, position)
 
 class ELexer(BaseLexer):
-    """XPath Logic and Function Expression Lexer"""
+    """XPath Logic and Function Expression Lexer (expects complete bytes)"""
 
     def read_word(self, value: bytearray, terminate: Optional[bytes] = None):
         return super().read_word(value, terminate or ESPECIAL)
@@ -208,6 +228,7 @@ class ELexer(BaseLexer):
         """
         parens = 1
         while True:
+            self.read_into(value, self.search(re_func_expression))
             char = self.read_byte()
             if char is None:
                 break
@@ -226,17 +247,12 @@ class ELexer(BaseLexer):
         """
         guess token type based on single character
         """
+        token = SINGLE_ETOKENS[char]
+        if token:
+            return token
         if char == ATSYM:
             self.read_word(value)
             return EToken.VARIABLE
-        if char == COMMA:
-            return EToken.COMMA
-        if char == EQUALS:
-            return EToken.EQUALS
-        if char == LESSTHAN:
-            return EToken.LT
-        if char == GREATERTHAN:
-            return EToken.GT
         if char == OPEN_PAREN:
             self.read_expression(value)
             return EToken.EXPRESSION